@@ -6,10 +6,27 @@
 #               classes: one to embody the game and its rules; one to embody
 #               its pieces and their variants.
 
+def is_immutable(value):
+    """
+    Checks whether a value can be shared between games without copying.
+    :param value: any
+    :return: bool
+    """
+    if value is None or type(value) in (bool, int, float, str):
+        return True
+    if type(value) is tuple:
+        return all(is_immutable(item) for item in value)
+    return False
+
+
 class ChessVar:
     """
     Represents a game of chess, its rules, and its top-level properties.
     """
+    # Starting position, built by the first game of a class and cloned by
+    # every later game of that class.
+    _template = None
+
     def __init__(self):
         """
         Initializes all starting values for the game.
@@ -26,9 +43,72 @@ class ChessVar:
         self._pawns = {}
         self._blast_radius = (abs(1), abs(1))
         self._victims = []
-        # Generate board and pieces upon init
-        self.make_board()
-        self.generate_pieces()
+        # Cached reachable destinations and watched squares, keyed by origin.
+        self._reach_cache = {}
+        self._reach_deps = {}
+        # Generate board and pieces upon init, or copy them if already built.
+        # Each class keeps its own template, so subclasses that change the
+        # starting position never share one with ChessVar.
+        template = type(self).__dict__.get("_template")
+        if template is None:
+            self.make_board()
+            self.generate_pieces()
+            # Fill the cache now, so every copied game starts with it warm.
+            for space in self._board:
+                self.get_reachable(space)
+            type(self)._template = self.clone()
+        else:
+            self.copy_position(template)
+
+    def clone(self):
+        """
+        Creates an independent copy of the game in its current position.
+        :return: object
+        """
+        game = type(self).__new__(type(self))
+        game.copy_position(self)
+        return game
+
+    def copy_position(self, other):
+        """
+        Replaces all game values with copies of another game's.
+        Pieces are copied once each, so no piece is shared between games.
+        :param other: object
+        :return: N/A
+        """
+        self.__dict__.update(other.__dict__)
+        # Map each original piece (by identity) to its copy.
+        pieces = {id(None): None}
+        for cell in other._board.values():
+            if cell["piece"] is not None:
+                pieces[id(cell["piece"])] = cell["piece"].clone()
+        for piece in list(other._pawns.values()) + [other._active_piece]:
+            if id(piece) not in pieces:
+                pieces[id(piece)] = piece.clone()
+
+        self._board = {}
+        for space, cell in other._board.items():
+            self._board[space] = {"xy": cell["xy"], "piece": pieces[id(cell["piece"])]}
+        self._pawns = {name: pieces[id(pawn)] for name, pawn in other._pawns.items()}
+        self._active_piece = pieces[id(other._active_piece)]
+        self._col_ref = dict(other._col_ref)
+        self._victims = list(other._victims)
+        # Cached lists and sets are replaced, never mutated, so they can be shared.
+        self._reach_cache = dict(other._reach_cache)
+        self._reach_deps = dict(other._reach_deps)
+
+        # Any other value (e.g. one added by a subclass) is deep copied unless
+        # it is immutable, reusing the piece copies made above.
+        copied = ("_board", "_pawns", "_active_piece", "_col_ref", "_victims",
+                  "_reach_cache", "_reach_deps")
+        memo = None
+        for name, value in other.__dict__.items():
+            if name in copied or is_immutable(value):
+                continue
+            if memo is None:
+                import copy
+                memo = {key: piece for key, piece in pieces.items() if piece is not None}
+            setattr(self, name, copy.deepcopy(value, memo))
 
     def set_active_piece(self, piece):
         """
@@ -219,6 +299,110 @@ class ChessVar:
         blackKing = King("e8", 0)
         self.place_piece(blackKing, "e8")
 
+    def get_space_name(self, xy):
+        """
+        Gets the name of the board space at specified xy coordinates.
+        :param xy: tuple
+        :return: string, or None if off the board
+        """
+        if not (0 <= xy[0] < self._grid_size and 0 <= xy[1] < self._grid_size):
+            return None
+        return chr(self._start_chr + xy[0]) + str(xy[1] + 1)
+
+    def get_watched_spaces(self, coord):
+        """
+        Gets every space whose contents can affect where the occupant of
+        the specified space may move: its candidate destinations and every
+        space along its rays.
+        :param coord: string
+        :return: set
+        """
+        piece = self._board[coord]["piece"]
+        x, y = self._board[coord]["xy"]
+        piece_type = piece.get_symbol().lower()
+
+        if piece_type == "p":
+            forward = 1 if piece.get_color() == 1 else -1
+            offsets = [(0, forward), (0, 2 * forward), (1, forward), (-1, forward)]
+        elif piece_type == "n":
+            offsets = piece.get_range()
+        elif piece_type == "k":
+            offsets = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+        else:
+            offsets = []
+            if piece_type in ("r", "q"):
+                steps = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+            else:
+                steps = []
+            if piece_type in ("b", "q"):
+                steps += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+            for step_x, step_y in steps:
+                for dist in range(1, self._grid_size):
+                    offsets.append((step_x * dist, step_y * dist))
+
+        watched = set()
+        for x_delta, y_delta in offsets:
+            space = self.get_space_name((x + x_delta, y + y_delta))
+            if space is not None:
+                watched.add(space)
+        return watched
+
+    def get_reachable(self, coord):
+        """
+        Gets every space the occupant of the specified space can move to,
+        ignoring whose turn it is. Results are cached per origin and only
+        recomputed after a watched space changes.
+        :param coord: string
+        :return: list
+        """
+        if self._game_state == "WHITE_WON" or self._game_state == "BLACK_WON":
+            return []
+
+        piece = self._board[coord]["piece"]
+        if not piece:
+            return []
+
+        if coord in self._reach_cache:
+            return list(self._reach_cache[coord])
+
+        watched = self.get_watched_spaces(coord)
+        previous_piece = self._active_piece
+        self.set_active_piece(piece)
+        reachable = []
+        for destination in self._board:
+            if destination not in watched:
+                continue
+            if not self.verify_range(destination):
+                continue
+            if self.check_path(coord, destination) is False:
+                continue
+            target = self._board[destination]["piece"]
+            if target:
+                # Kings cannot capture; friendly pieces cannot be captured.
+                if piece.get_symbol().lower() == "k":
+                    continue
+                if target.get_color() == piece.get_color():
+                    continue
+            reachable.append(destination)
+        self.set_active_piece(previous_piece)
+
+        self._reach_cache[coord] = reachable
+        self._reach_deps[coord] = watched
+        return list(reachable)
+
+    def invalidate_reachable(self, coord):
+        """
+        Discards cached destinations of the occupant of the specified space
+        and of every piece watching it.
+        :param coord: string
+        :return: N/A
+        """
+        stale = [origin for origin in self._reach_deps
+                 if origin == coord or coord in self._reach_deps[origin]]
+        for origin in stale:
+            del self._reach_cache[origin]
+            del self._reach_deps[origin]
+
     def make_move(self, origin, destination):
         """
         Moves a piece from specified origin to specified destination.
@@ -291,19 +475,19 @@ class ChessVar:
         :param color: int
         :return: bool - True if cell is empty or contains enemy piece, False if contains friendly piece
         """
-        for cell in self._board:
-            if self._board[cell]["xy"] == tup:
-                occupant = self._board[cell]["piece"]
-                # If cell is empty, it's valid (no friendly piece blocking)
-                if occupant is None:
-                    return True
-                # If occupant is same color -> blocked by friendly
-                if occupant.get_color() == color:
-                    return False
-                # Occupant is enemy -> not blocked (capture eligibility handled elsewhere)
-                return True
+        cell = self.get_space_name(tup)
         # If cell coordinate not found, treat as blocked/invalid
-        return False
+        if cell is None:
+            return False
+        occupant = self._board[cell]["piece"]
+        # If cell is empty, it's valid (no friendly piece blocking)
+        if occupant is None:
+            return True
+        # If occupant is same color -> blocked by friendly
+        if occupant.get_color() == color:
+            return False
+        # Occupant is enemy -> not blocked (capture eligibility handled elsewhere)
+        return True
 
     def check_path(self, origin, destination):
         """
@@ -455,6 +639,9 @@ class ChessVar:
         piece.set_pos(coord)
         # Set cell "piece" subkey to piece object itself.
         self._board[coord]["piece"] = piece
+        # Nothing to invalidate while the cache is empty (e.g. during setup).
+        if self._reach_deps:
+            self.invalidate_reachable(coord)
 
     def remove_piece(self, piece, coord):
         """
@@ -465,6 +652,9 @@ class ChessVar:
         """
         piece.set_pos(None)
         self._board[coord]["piece"] = None
+        # Nothing to invalidate while the cache is empty (e.g. during setup).
+        if self._reach_deps:
+            self.invalidate_reachable(coord)
 
     def victimize(self, destination):
         """
@@ -516,6 +706,16 @@ class Piece:
         if self._color == 1:
             self._turn_affinity = True
 
+    def clone(self):
+        """
+        Creates a copy of the piece with the same values.
+        Range and start position lists are never modified, so they are shared.
+        :return: object
+        """
+        piece = self.__class__.__new__(self.__class__)
+        piece.__dict__.update(self.__dict__)
+        return piece
+
     def get_pos(self):
         """
         Gets position of piece.
@@ -0,0 +1,118 @@
+# Description: Benchmarks cold-start costs of the ChessVar module: the time
+#               taken to import it in a fresh interpreter and the number of
+#               new games that can be constructed per second. Also times the
+#               reachable-square queries a frontend makes after each move.
+
+import contextlib
+import io
+import os
+import random
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def time_interpreter(code, runs):
+    """
+    Gets the best wall time of running code in a fresh interpreter.
+    :param code: string
+    :param runs: int
+    :return: float (seconds)
+    """
+    best = None
+    for run in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench_import(runs=20):
+    """
+    Gets the time importing ChessVar adds to interpreter startup.
+    :param runs: int
+    :return: float (seconds)
+    """
+    return time_interpreter("import ChessVar", runs) - time_interpreter("pass", runs)
+
+
+def bench_games(seconds=1.0):
+    """
+    Gets how many new games are constructed per second.
+    The first (template-building) game is timed separately.
+    :param seconds: float
+    :return: tuple (first game seconds, games per second)
+    """
+    sys.path.insert(0, HERE)
+    from ChessVar import ChessVar
+
+    start = time.perf_counter()
+    ChessVar()
+    first = time.perf_counter() - start
+
+    games = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for unit in range(100):
+            ChessVar()
+        games += 100
+    return first, games / (time.perf_counter() - start)
+
+
+def bench_queries(games=20, plies=60, queries=50, seed=0):
+    """
+    Gets the time taken by the reachable-square queries made after each move.
+    Each move is followed by the given number of get_reachable calls on
+    randomly chosen pieces of the side to play, as a hovering user would.
+    Moves are chosen with a separate game, so its queries are not counted.
+    :param games: int
+    :param plies: int
+    :param queries: int
+    :param seed: int
+    :return: sorted list of per-move times (seconds)
+    """
+    sys.path.insert(0, HERE)
+    from ChessVar import ChessVar
+
+    rng = random.Random(seed)
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for game_num in range(games):
+            game = ChessVar()
+            picker = ChessVar()
+            for ply in range(plies):
+                if game.get_game_state() != "UNFINISHED":
+                    break
+                board = game.get_board()
+                mine = [space for space in board if board[space]["piece"]
+                        and board[space]["piece"].get_turn_affinity() == game.get_turn()]
+
+                start = time.perf_counter()
+                for query in range(queries):
+                    game.get_reachable(rng.choice(mine))
+                times.append(time.perf_counter() - start)
+
+                moves = [(origin, destination) for origin in mine
+                         for destination in picker.get_reachable(origin)]
+                if not moves:
+                    break
+                move = rng.choice(moves)
+                picker.make_move(*move)
+                game.make_move(*move)
+    return sorted(times)
+
+
+if __name__ == "__main__":
+    import_time = bench_import()
+    first, rate = bench_games()
+    print("import time:      %.2f ms" % (import_time * 1000))
+    print("first game:       %.2f ms" % (first * 1000))
+    print("games per second: %.0f" % rate)
+    times = bench_queries()
+    print("50 queries/move:  median %.3f ms  p90 %.3f ms  over 1 ms: %.0f%%"
+          % (times[len(times) // 2] * 1000, times[len(times) * 9 // 10] * 1000,
+             100.0 * sum(1 for t in times if t > 0.001) / len(times)))
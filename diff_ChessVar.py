@@ -0,0 +1,425 @@
+# Description: Differential fuzz harness for atomic chess backends. Plays
+#               random and adversarial move sequences through the reference
+#               ChessVar and a candidate backend, compares board, turn and
+#               game state after every move, shrinks any mismatch to a
+#               short reproducing sequence, and reports the speed ratio.
+#
+# Usage: python diff_ChessVar.py [module:Class] [games] [seed]
+#        (the candidate defaults to ChessVar itself, as a self-check)
+#        python diff_ChessVar.py --reachable [games] [seed]
+#        (checks cached get_reachable results against make_move)
+#        python diff_ChessVar.py --clones [games] [seed]
+#        (checks that new games and clones share no mutable state)
+
+import contextlib
+import importlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ChessVar import ChessVar
+
+
+def load_backend(name):
+    """
+    Imports a backend class given as "module:Class".
+    :param name: string
+    :return: class
+    """
+    module_name, class_name = name.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def snapshot(game):
+    """
+    Gets everything compared between backends: each occupied space with its
+    piece's symbol and move count, the current turn, and the game state.
+    :param game: object
+    :return: tuple
+    """
+    board = game.get_board()
+    pieces = tuple(
+        (space, board[space]["piece"].get_symbol(), board[space]["piece"].get_move_count())
+        for space in sorted(board) if board[space]["piece"]
+    )
+    return pieces, game.get_turn(), game.get_game_state()
+
+
+def play(backend, moves, stop_at_mismatch=None):
+    """
+    Plays a move sequence, recording the result of each move.
+    :param backend: class
+    :param moves: list of (origin, destination) tuples
+    :param stop_at_mismatch: list of records to compare against, or None
+    :return: list of (make_move result, snapshot) tuples. A move that
+             raises is recorded as ("raised", exception name) and ends
+             the sequence, so a crash counts as a mismatch like any other.
+             A game that cannot be constructed is recorded the same way.
+    """
+    records = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            game = backend()
+        except Exception as exc:
+            return [("raised", type(exc).__name__)]
+        for index, (origin, destination) in enumerate(moves):
+            try:
+                records.append((game.make_move(origin, destination), snapshot(game)))
+            except Exception as exc:
+                records.append(("raised", type(exc).__name__))
+                break
+            if stop_at_mismatch is not None and records[index] != stop_at_mismatch[index]:
+                break
+    return records
+
+
+def first_mismatch(reference, candidate, moves):
+    """
+    Gets the index of the first move after which the backends disagree.
+    :param reference: class
+    :param candidate: class
+    :param moves: list of (origin, destination) tuples
+    :return: int, or None if they always agree
+    """
+    expected = play(reference, moves)
+    actual = play(candidate, moves, expected)
+    for index in range(len(actual)):
+        if actual[index] != expected[index]:
+            return index
+    return None
+
+
+def shrink(reference, candidate, moves):
+    """
+    Shortens a mismatching move sequence while it still mismatches, first by
+    removing ever smaller chunks of moves, then by removing any two moves
+    one white and one black apart (which keeps the turn order of the rest).
+    Moves are only ever removed, so the result cannot lose any single move
+    or pair, but a shorter repro using other moves may still exist.
+    :param reference: class
+    :param candidate: class
+    :param moves: list of (origin, destination) tuples
+    :return: list
+    """
+    def attempt(trial):
+        index = first_mismatch(reference, candidate, trial) if trial else None
+        if index is None:
+            return None
+        return trial[:index + 1]
+
+    moves = moves[:first_mismatch(reference, candidate, moves) + 1]
+    chunk = len(moves) // 2
+    while chunk >= 1:
+        start = 0
+        while start < len(moves):
+            shorter = attempt(moves[:start] + moves[start + chunk:])
+            if shorter is not None:
+                moves = shorter
+            else:
+                start += chunk
+        chunk //= 2
+
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for first in range(len(moves)):
+            for second in range(first + 1, len(moves), 2):
+                shorter = attempt(moves[:first] + moves[first + 1:second] + moves[second + 1:])
+                if shorter is not None:
+                    moves = shorter
+                    shrunk = True
+                    break
+            if shrunk:
+                break
+    return moves
+
+
+def candidate_moves(game):
+    """
+    Gets every move the side to play can make, split into captures and
+    quiet moves.
+    :param game: object
+    :return: tuple of lists
+    """
+    captures = []
+    quiet = []
+    board = game.get_board()
+    for origin in board:
+        piece = board[origin]["piece"]
+        if piece is None or piece.get_turn_affinity() != game.get_turn():
+            continue
+        for destination in game.get_reachable(origin):
+            if board[destination]["piece"]:
+                captures.append((origin, destination))
+            else:
+                quiet.append((origin, destination))
+    return captures, quiet
+
+
+def adversarial_moves(game):
+    """
+    Gets moves aimed at the rules most easily broken by a rewrite: kings
+    trying to capture, captures next to pawns (which survive blasts) and
+    next to kings, and pieces trying to take friendly pieces.
+    :param game: object
+    :return: list of (origin, destination) tuples
+    """
+    moves = []
+    board = game.get_board()
+    for origin in board:
+        piece = board[origin]["piece"]
+        if piece is None or piece.get_turn_affinity() != game.get_turn():
+            continue
+        x, y = board[origin]["xy"]
+        for destination in board:
+            target = board[destination]["piece"]
+            if target is None:
+                continue
+            x_2, y_2 = board[destination]["xy"]
+            if piece.get_symbol().lower() == "k" and max(abs(x_2 - x), abs(y_2 - y)) == 1:
+                moves.append((origin, destination))
+            elif target.get_color() == piece.get_color() and destination != origin:
+                moves.append((origin, destination))
+    for origin, destination in candidate_moves(game)[0]:
+        x, y = board[destination]["xy"]
+        for space in board:
+            neighbour = board[space]["piece"]
+            x_2, y_2 = board[space]["xy"]
+            if neighbour and space != destination and max(abs(x_2 - x), abs(y_2 - y)) == 1:
+                if neighbour.get_symbol().lower() in ("p", "k"):
+                    moves.append((origin, destination))
+                    break
+    return moves
+
+
+def generate_sequence(rng, length):
+    """
+    Generates a move sequence by playing the reference backend, mixing
+    legal moves, adversarial moves and arbitrary (usually illegal) ones.
+    Once the game is won, a few more arbitrary moves are added (all of which
+    must be rejected) and the sequence ends.
+    :param rng: random.Random
+    :param length: int
+    :return: list of (origin, destination) tuples
+    """
+    spaces = list(ChessVar().get_board())
+    moves = []
+    plies_after_end = 3
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = ChessVar()
+        for ply in range(length):
+            if game.get_game_state() != "UNFINISHED":
+                if plies_after_end == 0:
+                    break
+                plies_after_end -= 1
+            captures, quiet = candidate_moves(game)
+            roll = rng.random()
+            if roll < 0.1 or not (captures or quiet):
+                move = (rng.choice(spaces), rng.choice(spaces))
+            elif roll < 0.25:
+                move = rng.choice(adversarial_moves(game) or captures + quiet)
+            elif roll < 0.55 and captures:
+                move = rng.choice(captures)
+            else:
+                move = rng.choice(captures + quiet)
+            moves.append(move)
+            game.make_move(*move)
+    return moves
+
+
+def time_backend(backend, sequences):
+    """
+    Gets the time taken to construct a game and make every move of each
+    sequence through a backend, without the snapshots taken by play().
+    :param backend: class
+    :param sequences: list
+    :return: float (seconds)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for moves in sequences:
+            game = backend()
+            for origin, destination in moves:
+                game.make_move(origin, destination)
+        return time.perf_counter() - start
+
+
+def accepted_moves(game, origin):
+    """
+    Gets every destination make_move accepts for the occupant of a space,
+    trying each one on a clone with the turn set to that piece's side.
+    :param game: object
+    :param origin: string
+    :return: list
+    """
+    accepted = []
+    trial = None
+    for destination in game.get_board():
+        if trial is None:
+            trial = game.clone()
+            if trial.get_turn() != trial.get_occupant(origin).get_turn_affinity():
+                trial.turn_toggle()
+        # A rejected move changes nothing, so the clone is only replaced
+        # after an accepted one.
+        if trial.make_move(origin, destination):
+            accepted.append(destination)
+            trial = None
+    return accepted
+
+
+def check_reachable(games=10, seed=0, length=50):
+    """
+    Plays sequences through ChessVar and, after every move, compares for each
+    occupied space the cached get_reachable result, a freshly computed one,
+    and the destinations make_move accepts.
+    :param games: int
+    :param seed: int
+    :param length: int
+    :return: string describing the first problem, or None if none was found
+    """
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for game_num in range(games):
+            game = ChessVar()
+            for ply, move in enumerate(generate_sequence(rng, length)):
+                if game.get_game_state() != "UNFINISHED":
+                    break
+                board = game.get_board()
+                for origin in board:
+                    if board[origin]["piece"] is None:
+                        continue
+                    cached = sorted(game.get_reachable(origin))
+                    fresh = game.clone()
+                    fresh.invalidate_reachable(origin)
+                    expected = sorted(accepted_moves(game, origin))
+                    if cached != sorted(fresh.get_reachable(origin)) or cached != expected:
+                        return ("game %d ply %d: %s reaches %s, make_move accepts %s"
+                                % (game_num, ply, origin, cached, expected))
+                game.make_move(*move)
+    return None
+
+
+class HistoryVar(ChessVar):
+    """
+    Represents a game that also records its moves, in a list added by an
+    overridden make_board, to catch state shared between copied games.
+    """
+    def make_board(self):
+        """
+        Generates the board and an empty move history.
+        :return: N/A
+        """
+        super().make_board()
+        self._history = []
+
+    def make_move(self, origin, destination):
+        """
+        Records the move, then makes it.
+        :param origin: string
+        :param destination: string
+        :return: bool
+        """
+        self._history.append((origin, destination))
+        return super().make_move(origin, destination)
+
+
+def check_clones(games=20, seed=0, length=80):
+    """
+    Plays sequences through games built from the class template and through
+    clones, confirming no game changes another's board or move history.
+    :param games: int
+    :param seed: int
+    :param length: int
+    :return: string describing the first problem, or None if none was found
+    """
+    rng = random.Random(seed)
+    start = snapshot(HistoryVar())
+    with contextlib.redirect_stdout(io.StringIO()):
+        for game_num in range(games):
+            moves = generate_sequence(rng, length)
+            half = len(moves) // 2
+            game = HistoryVar()
+            for move in moves[:half]:
+                game.make_move(*move)
+            played = snapshot(game)
+
+            fresh = HistoryVar()
+            if snapshot(fresh) != start or fresh._history:
+                return "new game %d did not start from the initial position" % game_num
+            if HistoryVar._template._history:
+                return "game %d changed the template" % game_num
+
+            copied = game.clone()
+            if type(copied) is not HistoryVar:
+                return "clone of game %d is a %s" % (game_num, type(copied).__name__)
+            for move in moves[half:]:
+                copied.make_move(*move)
+            if snapshot(game) != played or game._history != moves[:half]:
+                return "clone of game %d changed the original" % game_num
+    return None
+
+
+def run(candidate, games=200, seed=0, length=80):
+    """
+    Fuzzes a candidate backend against the reference ChessVar.
+    :param candidate: class
+    :param games: int
+    :param seed: int
+    :param length: int
+    :return: shrunk mismatching sequence, or None if none was found
+    """
+    rng = random.Random(seed)
+    sequences = [generate_sequence(rng, length) for game in range(games)]
+    for moves in sequences:
+        if first_mismatch(ChessVar, candidate, moves) is not None:
+            return shrink(ChessVar, candidate, moves)
+
+    # Alternate the backends and keep each one's best pass, to reduce noise.
+    reference_time = candidate_time = None
+    for repeat in range(3):
+        elapsed = time_backend(ChessVar, sequences)
+        if reference_time is None or elapsed < reference_time:
+            reference_time = elapsed
+        elapsed = time_backend(candidate, sequences)
+        if candidate_time is None or elapsed < candidate_time:
+            candidate_time = elapsed
+    print("%d sequences agree" % len(sequences))
+    print("reference: %.3f s  candidate: %.3f s  speedup: %.2fx"
+          % (reference_time, candidate_time, reference_time / candidate_time))
+    return None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--reachable":
+        games = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+        seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+        problem = check_reachable(games, seed)
+        if problem is not None:
+            print(problem)
+            sys.exit(1)
+        print("get_reachable matches make_move in %d games" % games)
+        sys.exit(0)
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--clones":
+        games = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+        seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+        problem = check_clones(games, seed)
+        if problem is not None:
+            print(problem)
+            sys.exit(1)
+        print("%d games and their clones are independent" % games)
+        sys.exit(0)
+
+    backend = load_backend(sys.argv[1]) if len(sys.argv) > 1 else ChessVar
+    games = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    mismatch = run(backend, games, seed)
+    if mismatch is not None:
+        print("mismatch reproduced by %d moves:" % len(mismatch))
+        for origin, destination in mismatch:
+            print("  make_move(%r, %r)" % (origin, destination))
+        sys.exit(1)